@@ -3,12 +3,55 @@
 from __future__ import annotations
 
 import argparse
+import io
+import itertools
+import os
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple, List, Any
+from typing import Dict, Optional, Set, Tuple, List, Any
 
 import pygame
 
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+except ImportError:
+    TurboJPEG = None
+    TJPF_RGB = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# A labels file holds 18 short strings; anything this big is not one
+MAX_LABELS_FILE_BYTES = 1_048_576
+
+
+# Key -> (digit index, digit value): QWERTY, ASDFGH, ZXCVBN select digits 0..2
+_KEY_TO_SLOT: Dict[int, Tuple[int, int]] = {
+    pygame.K_q: (0, 0), pygame.K_w: (0, 1), pygame.K_e: (0, 2),
+    pygame.K_r: (0, 3), pygame.K_t: (0, 4), pygame.K_y: (0, 5),
+    pygame.K_a: (1, 0), pygame.K_s: (1, 1), pygame.K_d: (1, 2),
+    pygame.K_f: (1, 3), pygame.K_g: (1, 4), pygame.K_h: (1, 5),
+    pygame.K_z: (2, 0), pygame.K_x: (2, 1), pygame.K_c: (2, 2),
+    pygame.K_v: (2, 3), pygame.K_b: (2, 4), pygame.K_n: (2, 5),
+}
+
+# The same table packed by keycode: 0x80 | slot << 4 | value, 0 for unmapped keys.
+# Letter keycodes are their ASCII codes, so this stays small
+_KEY_LOOKUP = bytearray(max(_KEY_TO_SLOT) + 1)
+for _key, (_slot, _value) in _KEY_TO_SLOT.items():
+    _KEY_LOOKUP[_key] = 0x80 | (_slot << 4) | _value
+del _key, _slot, _value
+
 
 def _default_labels() -> Dict[str, List[str]]:
     values = [str(i) for i in range(6)]
@@ -18,6 +61,8 @@ def _default_labels() -> Dict[str, List[str]]:
 def _coerce_string_list(values: Any, expected_len: int = 6) -> Optional[List[str]]:
     if not isinstance(values, list) or len(values) != expected_len:
         return None
+    if all(type(v) is str for v in values):
+        return values
     coerced: List[str] = [str(v) for v in values]
     return coerced
 
@@ -34,20 +79,24 @@ def load_labels_file(path: Path) -> Dict[str, List[str]]:
     import re
 
     default = _default_labels()
-    raw_text: str
+    raw_bytes: bytes
     try:
-        raw_text = path.read_text(encoding="utf-8")
+        if path.stat().st_size > MAX_LABELS_FILE_BYTES:
+            print(f"Labels file '{path}' is too large; using defaults.", file=sys.stderr)
+            return default
+        raw_bytes = path.read_bytes()
     except Exception as exc:
         print(f"Failed to read labels file '{path}': {exc}", file=sys.stderr)
         return default
 
     data: Any
     try:
-        # Try parse as pure JSON first
-        data = json.loads(raw_text)
+        # Try parse as pure JSON first, straight from bytes
+        data = orjson.loads(raw_bytes) if orjson is not None else json.loads(raw_bytes)
     except Exception:
         # Try to extract an array from JS like: const slotOptions = [ ... ];
         try:
+            raw_text = raw_bytes.decode("utf-8")
             # Find first '[' and last ']' to capture the array literal
             start_idx = raw_text.find("[")
             end_idx = raw_text.rfind("]")
@@ -104,18 +153,58 @@ class PygameImageViewer:
         self.images_directory: Path = images_directory
         self.window_width, self.window_height = window_size
 
-        self.first_digit: int = 0
-        self.second_digit: int = 0
-        self.third_digit: int = 0
+        self._digits: List[int] = [0, 0, 0]
+        # Filename, path and caption for _digits, rebuilt only when a digit changes
+        self._filename: str = ""
+        self._image_path: Path = images_directory
+        self._caption_text: str = ""
+        self._update_current_image()
 
         self.labels: Dict[str, List[str]] = labels if labels is not None else _default_labels()
-
-        self.key_to_digit_mapping: Dict[int, Tuple[int, int]] = self._build_key_mapping()
-        self.surface_cache: Dict[Path, pygame.Surface] = {}
+        self._label_tuples: Tuple[Tuple[str, ...], ...] = (
+            tuple(self.labels['first']),
+            tuple(self.labels['second']),
+            tuple(self.labels['third']),
+        )
+        # Composed overlay for the (first, second, third) triple it was built for
+        self._label_cache_key: Optional[Tuple[int, int, int]] = None
+        self._label_surface: Optional[pygame.Surface] = None
+
+        # Surfaces scaled for a given window size (LRU, filled by the warm-up thread
+        # too); full-resolution decodes are never kept
+        self.max_cache_entries: int = 64
+        self.scaled_cache: "OrderedDict[Tuple[Path, int, int], Tuple[pygame.Surface, pygame.Rect]]" = OrderedDict()
+        # Warm-up workers cache surfaces that are not converted to the display format
+        # yet (convert() is left to the main thread); these keys have been converted
+        self._display_ready: Set[Tuple[Path, int, int]] = set()
+        self.cache_lock = threading.Lock()
+        # Encoded file bodies, read once so later decodes never touch the disk
+        self._raw_bytes: Dict[Path, bytes] = {}
+        # The window is SCALED, so the warm-up runs once per session; this is set on
+        # shutdown so its remaining jobs stop early
+        self._warm_stop = threading.Event()
+        # Decode pool for the warm-up; shut down before pygame.quit() so no job
+        # touches the display afterwards
+        self._warm_executor: Optional[ThreadPoolExecutor] = None
+
+        # libjpeg-turbo decoder when PyTurboJPEG (and the native library) is available
+        self._tj: Optional[Any] = None
+        self._tj_scaling_factors: List[Tuple[int, int]] = []
+        if TurboJPEG is not None:
+            try:
+                self._tj = TurboJPEG()
+                # Smallest first, so the first factor that covers the window wins
+                self._tj_scaling_factors = sorted(self._tj.scaling_factors, key=lambda f: f[0] / f[1])
+            except Exception as exc:
+                print(f"libjpeg-turbo unavailable, using pygame.image.load: {exc}", file=sys.stderr)
 
         pygame.init()
-        pygame.display.set_caption("AI Art Box Viewer (Pygame)")
-        self.screen = pygame.display.set_mode((self.window_width, self.window_height), pygame.RESIZABLE)
+        self._caption: str = "AI Art Box Viewer (Pygame)"
+        pygame.display.set_caption(self._caption)
+        # SCALED keeps a fixed logical surface that SDL stretches to the window on the
+        # GPU, so resizing the window neither re-scales images nor drops caches
+        self.screen = pygame.display.set_mode((self.window_width, self.window_height), pygame.RESIZABLE | pygame.SCALED)
+        pygame.display.set_allow_screensaver(True)
         
         # Set custom window icon
         try:
@@ -128,29 +217,30 @@ class PygameImageViewer:
         except Exception as e:
             print(f"Could not set custom icon: {e}", file=sys.stderr)
         
-        self.clock = pygame.time.Clock()
+        # Longest the event loop sleeps when nothing happens; redraws are event-driven
+        self.idle_wait_ms: int = 500
         self.font = pygame.font.Font(None, 32)
+        # All 18 label strings rendered once, indexed [digit index][digit value]
+        self._label_surfaces: List[List[pygame.Surface]] = [
+            [self.font.render(text, True, (240, 240, 240)).convert_alpha() for text in row]
+            for row in self._label_tuples
+        ]
 
         self._render()
 
-    @staticmethod
-    def _build_key_mapping() -> Dict[int, Tuple[int, int]]:
-        mapping: Dict[int, Tuple[int, int]] = {}
-
-        first_keys = "qwerty"
-        second_keys = "asdfgh"
-        third_keys = "zxcvbn"
-
-        for value, char in enumerate(first_keys):
-            mapping[getattr(pygame, f"K_{char}")] = (0, value)
+        self._start_cache_warmup()
 
-        for value, char in enumerate(second_keys):
-            mapping[getattr(pygame, f"K_{char}")] = (1, value)
+    @property
+    def first_digit(self) -> int:
+        return self._digits[0]
 
-        for value, char in enumerate(third_keys):
-            mapping[getattr(pygame, f"K_{char}")] = (2, value)
+    @property
+    def second_digit(self) -> int:
+        return self._digits[1]
 
-        return mapping
+    @property
+    def third_digit(self) -> int:
+        return self._digits[2]
 
     def _create_icon_surface(self) -> pygame.Surface:
         """Create a pygame surface for the window icon from the custom icon"""
@@ -160,6 +250,12 @@ class PygameImageViewer:
             if icon_path.exists():
                 # Load the original jpeg and scale it down
                 icon_size = 32
+                if Image is not None:
+                    # draft() lets libjpeg decode at 1/2..1/8 scale instead of full size
+                    with Image.open(icon_path) as image:
+                        image.draft("RGB", (icon_size, icon_size))
+                        image = image.convert("RGB").resize((icon_size, icon_size))
+                    return pygame.image.frombuffer(image.tobytes(), image.size, "RGB")
                 original_surface = pygame.image.load(str(icon_path))
                 scaled_surface = pygame.transform.scale(original_surface, (icon_size, icon_size))
                 return scaled_surface
@@ -176,67 +272,239 @@ class PygameImageViewer:
                         border_width)
         return surface
 
+    def _update_current_image(self) -> None:
+        self._filename = "-".join(map(str, self._digits)) + ".jpeg"
+        self._image_path = self.images_directory / self._filename
+        self._caption_text = f"AI Art Box Viewer (Pygame) — {self._filename}"
+
     def _current_filename(self) -> str:
-        return f"{self.first_digit}-{self.second_digit}-{self.third_digit}.jpeg"
+        return self._filename
 
     def _current_image_path(self) -> Path:
-        return self.images_directory / self._current_filename()
+        return self._image_path
+
+    def _load_surface(self, path: Path, convert: bool = True) -> Optional[pygame.Surface]:
+        """Decode an image file into a display-format surface, uncached.
+
+        With convert=False (warm-up workers) the surface is left in a plain 24/32-bit
+        format for _to_display_format() to convert on the main thread.
+        """
+        buf = self._read_image_bytes(path)
+        if buf is None:
+            return None
+        surface = self._decode_jpeg(path, buf, convert)
+        if surface is None:
+            try:
+                loaded = pygame.image.load(io.BytesIO(buf), path.name)
+                if convert:
+                    surface = self._to_display_format(loaded, path)
+                elif loaded.get_bitsize() < 24:
+                    # smoothscale needs 24/32-bit pixels (paletted or grayscale files)
+                    surface = pygame.Surface(loaded.get_size(), pygame.SRCALPHA, 32)
+                    surface.blit(loaded, (0, 0))
+                else:
+                    surface = loaded
+            except Exception as exc:
+                print(f"Failed to load image '{path}': {exc}", file=sys.stderr)
+                return None
+        return surface
+
+    @staticmethod
+    def _to_display_format(surface: pygame.Surface, path: Path) -> pygame.Surface:
+        """Convert to the display format; main thread only, as it uses the display surface."""
+        # JPEGs have no alpha; an opaque surface blits as a plain copy
+        if path.suffix.lower() in (".jpg", ".jpeg"):
+            return surface.convert()
+        return surface.convert_alpha()
+
+    def _read_image_bytes(self, path: Path) -> Optional[bytes]:
+        """Get the encoded file body, from memory after the first read; None if missing."""
+        buf = self._raw_bytes.get(path)
+        if buf is not None:
+            return buf
+        try:
+            buf = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as exc:
+            print(f"Failed to read image '{path}': {exc}", file=sys.stderr)
+            return None
+        self._raw_bytes[path] = buf
+        return buf
 
-    def _load_surface(self, path: Path) -> Optional[pygame.Surface]:
-        if path in self.surface_cache:
-            return self.surface_cache[path]
-        if not path.exists():
+    def _decode_jpeg(self, path: Path, buf: bytes, convert: bool = True) -> Optional[pygame.Surface]:
+        """Decode a JPEG with libjpeg-turbo; None means fall back to pygame.image.load."""
+        if self._tj is None or path.suffix.lower() not in (".jpg", ".jpeg"):
             return None
         try:
-            surface = pygame.image.load(str(path)).convert_alpha()
-            self.surface_cache[path] = surface
-            return surface
+            src_w, src_h = self._tj.decode_header(buf)[:2]
+            scaling_factor = self._pick_scaling_factor(src_w, src_h)
+            arr = self._tj.decode(buf, pixel_format=TJPF_RGB, scaling_factor=scaling_factor)
+            height, width = arr.shape[:2]
+            surface = pygame.image.frombuffer(arr.tobytes(), (width, height), "RGB")
+            # JPEGs carry no alpha, so an opaque display-format surface is enough
+            return surface.convert() if convert else surface
         except Exception as exc:
-            print(f"Failed to load image '{path}': {exc}", file=sys.stderr)
+            print(f"libjpeg-turbo decode failed for '{path}': {exc}", file=sys.stderr)
             return None
 
-    def _render(self) -> None:
-        self.screen.fill((0, 0, 0))
+    def _pick_scaling_factor(self, src_w: int, src_h: int) -> Optional[Tuple[int, int]]:
+        """Smallest DCT scaling factor that still covers the window, so smoothscale only shrinks."""
+        target_w, target_h = self.screen.get_size()
+        needed_scale = min(target_w / src_w, target_h / src_h)
+        for num, denom in self._tj_scaling_factors:
+            if num / denom >= needed_scale:
+                return (num, denom)
+        return None
 
+    def _start_cache_warmup(self) -> None:
+        """Decode and scale the image set for the current window in the background."""
+        # libjpeg-turbo and smoothscale release the GIL, so decodes spread across cores
+        self._warm_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+        threading.Thread(target=self._warm_cache, args=(self._warm_executor,), daemon=True).start()
+
+    def _stop_cache_warmup(self) -> None:
+        """Cancel queued warm-up decodes and wait for the running ones to finish."""
+        self._warm_stop.set()
+        if self._warm_executor is not None:
+            self._warm_executor.shutdown(wait=True, cancel_futures=True)
+            self._warm_executor = None
+
+    def _warm_cache(self, executor: ThreadPoolExecutor) -> None:
+        """Pre-scale every 'd0-d1-d2.jpeg' so key presses are a lookup and a blit."""
+        paths = [self.images_directory / "{}-{}-{}.jpeg".format(*digits) for digits in itertools.product(range(6), repeat=3)]
+        # Pull all file bodies into memory first; decoding then never waits on the disk
+        for path in paths:
+            if self._warm_stop.is_set():
+                return
+            self._read_image_bytes(path)
+        try:
+            for path in paths:
+                executor.submit(self._warm_one, path)
+        except RuntimeError:
+            # The pool was shut down (viewer closing) while submitting
+            pass
+
+    def _warm_one(self, path: Path) -> None:
+        if self._warm_stop.is_set():
+            return
+        try:
+            self._get_scaled_surface_and_rect(path, warm=True)
+        except Exception as exc:
+            print(f"Warm-up failed for {path.name}: {exc}", file=sys.stderr)
+
+    def _render(self) -> None:
         image_path = self._current_image_path()
-        surface = self._load_surface(image_path)
+        scaled = self._get_scaled_surface_and_rect(image_path)
 
-        if surface is None:
+        if scaled is None:
+            self.screen.fill((0, 0, 0))
             message = f"Missing: {image_path.name}"
             text_surface = self.font.render(message, True, (220, 220, 220))
             rect = text_surface.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2))
             self.screen.blit(text_surface, rect)
-            pygame.display.set_caption(f"AI Art Box Viewer (Pygame) — {self._current_filename()}")
+            self._set_caption(self._caption_text)
             pygame.display.flip()
             # Do not update last surface on missing image
             return
 
-        scaled_surface, blit_rect = self._get_scaled_surface_and_rect(surface)
-
-        self.screen.fill((0, 0, 0))
-        self.screen.blit(scaled_surface, blit_rect)
-        pygame.display.set_caption(f"AI Art Box Viewer (Pygame) — {self._current_filename()}")
-        self._draw_labels_overlay()
+        scaled_surface, blit_rect = scaled
+
+        # Only the letterbox bars need clearing, unless the image has alpha
+        if scaled_surface.get_flags() & pygame.SRCALPHA:
+            self.screen.fill((0, 0, 0))
+        else:
+            for rect in self._letterbox_rects(blit_rect):
+                self.screen.fill((0, 0, 0), rect)
+        # Image and top-left label box in one call
+        self.screen.blits(((scaled_surface, blit_rect), (self._get_labels_overlay(), (10, 10))), doreturn=False)
+        self._set_caption(self._caption_text)
         pygame.display.flip()
 
-    def _get_scaled_surface_and_rect(self, surface: pygame.Surface) -> Tuple[pygame.Surface, pygame.Rect]:
+    def _set_caption(self, caption: str) -> None:
+        # Resizes re-render the same image; skip the window-manager call then
+        if caption != self._caption:
+            pygame.display.set_caption(caption)
+            self._caption = caption
+
+    def _letterbox_rects(self, blit_rect: pygame.Rect) -> List[pygame.Rect]:
+        screen_w, screen_h = self.screen.get_size()
+        rects: List[pygame.Rect] = []
+        if blit_rect.top > 0:
+            rects.append(pygame.Rect(0, 0, screen_w, blit_rect.top))
+        if blit_rect.bottom < screen_h:
+            rects.append(pygame.Rect(0, blit_rect.bottom, screen_w, screen_h - blit_rect.bottom))
+        if blit_rect.left > 0:
+            rects.append(pygame.Rect(0, blit_rect.top, blit_rect.left, blit_rect.height))
+        if blit_rect.right < screen_w:
+            rects.append(pygame.Rect(blit_rect.right, blit_rect.top, screen_w - blit_rect.right, blit_rect.height))
+        return rects
+
+    def _get_scaled_surface_and_rect(self, path: Path, warm: bool = False) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        """Get the surface scaled to the window and its centered rect, cached by size.
+
+        With warm=True (warm-up jobs) nothing is decoded or cached once the cache
+        is full, so the warm-up never evicts images.
+        """
         target_w, target_h = self.screen.get_size()
+        key = (path, target_w, target_h)
+        with self.cache_lock:
+            cached = self.scaled_cache.get(key)
+            if cached is not None:
+                if warm:
+                    return cached
+                self.scaled_cache.move_to_end(key)
+                if key in self._display_ready:
+                    return cached
+            elif warm and len(self.scaled_cache) >= self.max_cache_entries:
+                return None
+        if cached is not None:
+            # Cached by a warm-up worker: convert here, on the main thread, once
+            converted = (self._to_display_format(cached[0], path), cached[1])
+            with self.cache_lock:
+                if self.scaled_cache.get(key) is cached:
+                    self.scaled_cache[key] = converted
+                    self._display_ready.add(key)
+            return converted
+        surface = self._load_surface(path, convert=not warm)
+        if surface is None:
+            return None
         img_w, img_h = surface.get_size()
         scale = min(target_w / img_w, target_h / img_h)
         scaled_w = max(1, int(img_w * scale))
         scaled_h = max(1, int(img_h * scale))
-        scaled_surface = pygame.transform.smoothscale(surface, (scaled_w, scaled_h))
+        scaled_surface = self._resize_surface(surface, (scaled_w, scaled_h), convert=not warm)
         blit_rect = scaled_surface.get_rect(center=(target_w // 2, target_h // 2))
+        with self.cache_lock:
+            if warm and len(self.scaled_cache) >= self.max_cache_entries:
+                # Other warm-up jobs filled the cache while this one decoded
+                return scaled_surface, blit_rect
+            self.scaled_cache[key] = (scaled_surface, blit_rect)
+            if not warm:
+                self._display_ready.add(key)
+            while len(self.scaled_cache) > self.max_cache_entries:
+                self._display_ready.discard(self.scaled_cache.popitem(last=False)[0])
         return scaled_surface, blit_rect
 
-    def _draw_labels_overlay(self) -> None:
-        lines = [
-            self.labels['first'][self.first_digit],
-            self.labels['second'][self.second_digit],
-            self.labels['third'][self.third_digit],
-        ]
-
-        text_surfaces: List[pygame.Surface] = [self.font.render(line, True, (240, 240, 240)) for line in lines]
+    @staticmethod
+    def _resize_surface(surface: pygame.Surface, size: Tuple[int, int], convert: bool = True) -> pygame.Surface:
+        """Resize with Pillow (SIMD-accelerated in Pillow-SIMD) when available, else smoothscale."""
+        if Image is not None and not surface.get_flags() & pygame.SRCALPHA:
+            try:
+                image = Image.frombuffer("RGB", surface.get_size(), pygame.image.tobytes(surface, "RGB"), "raw", "RGB", 0, 1)
+                image = image.resize(size, Image.BILINEAR)
+                resized = pygame.image.frombuffer(image.tobytes(), image.size, "RGB")
+                return resized.convert() if convert else resized
+            except Exception as exc:
+                print(f"Pillow resize failed, using smoothscale: {exc}", file=sys.stderr)
+        return pygame.transform.smoothscale(surface, size)
+
+    def _get_labels_overlay(self) -> pygame.Surface:
+        key = tuple(self._digits)
+        if key == self._label_cache_key and self._label_surface is not None:
+            return self._label_surface
+
+        text_surfaces: List[pygame.Surface] = [row[digit] for row, digit in zip(self._label_surfaces, self._digits)]
         padding = 10
         gap = 4
         widths = [s.get_width() for s in text_surfaces]
@@ -253,33 +521,36 @@ class PygameImageViewer:
             y_offset = max(0, (fixed_line_height - s.get_height()) // 2)
             box_surface.blit(s, (padding, y + y_offset))
 
-        # Top-left corner placement
-        self.screen.blit(box_surface, (10, 10))
+        self._label_surface = box_surface.convert_alpha()
+        self._label_cache_key = key
+        return self._label_surface
 
     def run(self) -> None:
         running = True
         while running:
-            for event in pygame.event.get():
+            # Sleep until input arrives instead of polling at a fixed frame rate
+            event = pygame.event.wait(self.idle_wait_ms)
+            if event.type == pygame.NOEVENT:
+                continue
+            for event in [event] + pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.VIDEORESIZE:
-                    self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+                    # Logical size is unchanged; just present the frame again
                     self._render()
                 elif event.type == pygame.KEYDOWN:
                     if event.key in (pygame.K_ESCAPE,):
                         running = False
-                    elif event.key in self.key_to_digit_mapping:
-                        digit_index, digit_value = self.key_to_digit_mapping[event.key]
-                        if digit_index == 0:
-                            self.first_digit = digit_value
-                        elif digit_index == 1:
-                            self.second_digit = digit_value
-                        else:
-                            self.third_digit = digit_value
-                        self._render()
-
-            self.clock.tick(60)
-
+                    elif event.key < len(_KEY_LOOKUP):
+                        packed = _KEY_LOOKUP[event.key]
+                        slot, value = (packed >> 4) & 3, packed & 7
+                        # Re-selecting the current value is a no-op, skip the redraw
+                        if packed & 0x80 and self._digits[slot] != value:
+                            self._digits[slot] = value
+                            self._update_current_image()
+                            self._render()
+
+        self._stop_cache_warmup()
         pygame.quit()
 
 
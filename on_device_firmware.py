@@ -14,48 +14,180 @@ Images are displayed as {switch1-1}-{switch2-1}-{switch3-1}.jpeg
 
 from __future__ import annotations
 
+import os
 import sys
 import time
 import threading
 import json
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, Optional, Tuple, List, Any
-import smbus
+from typing import Callable, Dict, FrozenSet, Optional, Set, Tuple, List, Any
+from smbus2 import SMBus, i2c_msg
 try:
     import RPi.GPIO as GPIO
 except ImportError:
     print("Warning: RPi.GPIO not available. 3-way switch will not work.")
     GPIO = None
 
+# Optional: Pillow decodes with the GIL released, keeping the main loop responsive
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+# Optional: orjson parses the labels file straight from bytes
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import pygame
 from RPLCD.i2c import CharLCD
 
-# I2C multiplexer setup
-bus = smbus.SMBus(1)
-channel_lock = threading.Lock()
+# Image coordinates and filenames indexed by screensaver index (a * 36 + b * 6 + c)
+_INDEX_TO_COORDS = tuple((a, b, c) for a in range(6) for b in range(6) for c in range(6))
+_COORDS_TO_INDEX = {coords: index for index, coords in enumerate(_INDEX_TO_COORDS)}
+IMAGE_FILENAMES = tuple(f"{a}-{b}-{c}.jpeg" for a, b, c in _INDEX_TO_COORDS)
+_FILENAME_TO_INDEX = {name: index for index, name in enumerate(IMAGE_FILENAMES)}
+
+def _screensaver_cycle() -> Tuple[Tuple[int, int, int], ...]:
+    """Build a closed walk over all 216 coordinates that turns one switch by one
+    position per step, including the step from the last image back to the first
+    
+    Switches 2 and 3 follow a closed tour of their 6x6 grid (along row 0,
+    snaking back over columns 1-5, then home up column 0). At each point of that
+    tour, switch 1 sweeps its whole range, alternating direction; the tour has
+    an even length, so the last sweep ends next to the start.
+    """
+    plane = [(0, c) for c in range(6)]
+    for b in range(1, 6):
+        plane.extend((b, c) for c in (range(5, 0, -1) if b % 2 else range(1, 6)))
+    plane.extend((b, 0) for b in range(5, 0, -1))
+    order = []
+    for step, (b, c) in enumerate(plane):
+        order.extend((a, b, c) for a in (range(6) if step % 2 == 0 else range(5, -1, -1)))
+    return tuple(order)
+
+
+# Screensaver walk: consecutive images (wrapping around) are one switch click apart
+_SCREENSAVER_ORDER = _screensaver_cycle()
+assert len(set(_SCREENSAVER_ORDER)) == 216 and all(
+    sum(abs(p - q) for p, q in zip(_SCREENSAVER_ORDER[i - 1], _SCREENSAVER_ORDER[i])) == 1
+    for i in range(216)
+), "screensaver order must be a closed one-click walk over all images"
+_SCREENSAVER_POSITION = {coords: step for step, coords in enumerate(_SCREENSAVER_ORDER)}
+
+# Upper bound for the decoded image cache
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+
+def _available_memory() -> Optional[int]:
+    """Get MemAvailable from /proc/meminfo (free RAM plus reclaimable page cache)"""
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _default_cache_budget() -> int:
+    """Get the image cache budget: 256 MB or a quarter of available RAM, whichever is less
+    
+    Available RAM is MemAvailable, so page cache (e.g. the prefetched image
+    files) does not shrink the budget; free pages are the fallback elsewhere.
+    """
+    available = _available_memory()
+    if available is None:
+        try:
+            available = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        except (AttributeError, ValueError, OSError):
+            return MAX_CACHE_BYTES
+    return min(MAX_CACHE_BYTES, available // 4)
+
+
+# Posted by the switch monitor thread to wake the display loop
+SWITCH_CHANGED_EVENT = pygame.USEREVENT
+# Posted by the decode worker when the image the display is waiting for is ready
+IMAGE_READY_EVENT = pygame.USEREVENT + 1
+
+# I2C multiplexer setup (only ever touched from the switch monitor thread)
+bus = SMBus(1)
+MUX_ADDRESS = 0x70
+
+SWITCH_POSITIONS = 6
+
+
+def _decode_pcf8574_byte(data: int) -> int:
+    """Decode a PCF8574 byte to a switch position (1-based), 0 if invalid
+    
+    The selected position pulls exactly one pin low, so the inverted byte
+    must be a single set bit; its bit length is the position (P0 -> 1).
+    """
+    inv = (~data) & 0xFF
+    if inv and (inv & (inv - 1)) == 0 and inv.bit_length() <= SWITCH_POSITIONS:
+        return inv.bit_length()
+    return 0
+
+
+# PCF8574 byte -> 6-position switch position (1-6), 0 for invalid/between positions
+_POS_LUT = bytes(_decode_pcf8574_byte(value) for value in range(256))
 
 class ThreeWaySwitch:
     """Handles reading a 3-way switch connected to GPIO pins"""
     
-    def __init__(self, pin_a: int = 0, pin_b: int = 5):
+    def __init__(self, pin_a: int = 0, pin_b: int = 5) -> None:
         """Initialize 3-way switch on specified GPIO pins
         
         Args:
             pin_a: GPIO pin for first switch position
             pin_b: GPIO pin for second switch position
         """
-        self.pin_a = pin_a
-        self.pin_b = pin_b
-        self.current_position = 0  # 0, 1, or 2
+        self.pin_a: int = pin_a
+        self.pin_b: int = pin_b
+        self.current_position: int = 0  # 0, 1, or 2
+        # Called from the GPIO callback thread when an edge changes the position
+        self.on_change: Optional[Callable[[], None]] = None
+        # True once edge callbacks wake the reader on pin changes
+        self.edge_detect: bool = False
+        # Set by the edge callback, cleared by take_edge(); the pins may still be
+        # bouncing then, so the reader samples again shortly after
+        self._edge_seen: bool = False
         
         if GPIO is not None:
             GPIO.setmode(GPIO.BCM)
             GPIO.setup(self.pin_a, GPIO.IN, pull_up_down=GPIO.PUD_UP)
             GPIO.setup(self.pin_b, GPIO.IN, pull_up_down=GPIO.PUD_UP)
             print(f"3-way switch initialized on GPIO pins {pin_a} and {pin_b}")
+            self._sample()
+            try:
+                for pin in (self.pin_a, self.pin_b):
+                    GPIO.add_event_detect(pin, GPIO.BOTH, callback=self._on_edge, bouncetime=3)
+                self.edge_detect = True
+            except Exception as e:
+                print(f"3-way switch edge detection unavailable, polling instead: {e}")
         else:
             print("3-way switch disabled - RPi.GPIO not available")
     
+    def _on_edge(self, channel: int) -> None:
+        """GPIO edge callback: tell the reader to sample the pins
+        
+        The pins are not sampled here: this runs on the first accepted edge,
+        possibly mid-bounce, and the settling edge may fall inside bouncetime.
+        """
+        self._edge_seen = True
+        if self.on_change is not None:
+            self.on_change()
+    
+    def take_edge(self) -> bool:
+        """Return whether an edge arrived since the last call, and clear it"""
+        seen = self._edge_seen
+        self._edge_seen = False
+        return seen
+    
     def read_position(self) -> int:
         """Read current switch position (0, 1, or 2)
         
@@ -64,6 +196,10 @@ class ThreeWaySwitch:
             1: Pin A active (position 2) 
             2: Pin B active (position 3)
         """
+        return self._sample()
+    
+    def _sample(self) -> int:
+        """Read both pins and update current_position"""
         if GPIO is None:
             return 0
         
@@ -83,7 +219,7 @@ class ThreeWaySwitch:
             print(f"Error reading 3-way switch: {e}")
             return 0
     
-    def cleanup(self):
+    def cleanup(self) -> None:
         """Clean up GPIO resources"""
         if GPIO is not None:
             try:
@@ -91,21 +227,24 @@ class ThreeWaySwitch:
             except Exception:
                 pass
 
-def load_labels_file(path: Path) -> Optional[Dict[str, List[str]]]:
-    """Load labels from JSON file"""
+def load_labels_file(path: Path) -> Optional[Dict[str, Tuple[str, ...]]]:
+    """Load labels from JSON file as immutable tuples"""
     try:
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Validate structure
-        if isinstance(data, dict) and all(
-            key in data and isinstance(data[key], list) and len(data[key]) == 6
-            for key in ["first", "second", "third"]
-        ):
-            return data
-        else:
-            print(f"Invalid labels file structure in {path}")
-            return None
+        raw = path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        
+        # Validate and convert in one pass over the three keys
+        if isinstance(data, dict):
+            labels: Dict[str, Tuple[str, ...]] = {}
+            for key in ("first", "second", "third"):
+                values = data.get(key)
+                if not isinstance(values, list) or len(values) != 6:
+                    break
+                labels[key] = tuple(str(label) for label in values)
+            else:
+                return labels
+        print(f"Invalid labels file structure in {path}")
+        return None
     except Exception as e:
         print(f"Error loading labels file {path}: {e}")
         return None
@@ -113,23 +252,87 @@ def load_labels_file(path: Path) -> Optional[Dict[str, List[str]]]:
 class SwitchController:
     """Handles reading the three 6-position switches via I2C multiplexer and a 3-way mode switch"""
     
-    def __init__(self, labels_file: Optional[Path] = None, three_way_pin_a: int = 0, three_way_pin_b: int = 5):
+    def __init__(
+        self,
+        labels_file: Optional[Path] = None,
+        three_way_pin_a: int = 0,
+        three_way_pin_b: int = 5,
+        interrupt_pin: Optional[int] = None,
+    ) -> None:
+        """Initialize switch monitoring
+        
+        Args:
+            labels_file: Optional labels.json for the LCD
+            three_way_pin_a: GPIO pin for first 3-way switch position
+            three_way_pin_b: GPIO pin for second 3-way switch position
+            interrupt_pin: GPIO pin wired to the (ORed) PCF8574 INT lines; when
+                set, the idle monitor thread sleeps until an edge instead of polling
+        """
         # Switch device configuration from switch_monitor.py
-        self.devices = [
+        self.devices: List[Dict[str, Any]] = [
             {"name": "SWITCH_3", "channel": 0, "address": 0x24, "type": "Switch Controller"},
             {"name": "SWITCH_1", "channel": 1, "address": 0x24, "type": "Switch Controller"},
             {"name": "SWITCH_2", "channel": 2, "address": 0x24, "type": "Switch Controller"},
         ]
         
-        # Current switch positions (1-6, converted to 0-5 for image filenames)
-        self.switch_positions = {"SWITCH_1": 1, "SWITCH_2": 1, "SWITCH_3": 1}
-        self.last_values = {}
-        self.running = True
+        # Index of each switch in the published positions tuple
+        self.switch_slots: Dict[str, int] = {"SWITCH_1": 0, "SWITCH_2": 1, "SWITCH_3": 2}
+        # Per-device (name, last_values key, positions slot) and (channel, address),
+        # in self.devices order, so polling does no string formatting or dict lookups
+        self._device_table: Tuple[Tuple[str, str, int], ...] = tuple(
+            (dev['name'], f"ch{dev['channel']}_0x{dev['address']:02X}", self.switch_slots[dev['name']])
+            for dev in self.devices
+        )
+        self._device_bus: Tuple[Tuple[int, int], ...] = tuple(
+            (dev['channel'], dev['address']) for dev in self.devices
+        )
+        
+        # Current switch positions (1-6, converted to 0-5 for image filenames).
+        # Only the monitor thread writes this; it is replaced as a whole tuple
+        # so readers on other threads never see a partial update.
+        self._positions_atomic: Tuple[int, int, int] = (1, 1, 1)
+        # Image coordinates derived from those positions, rebuilt only when they change
+        self._image_coords: Tuple[int, int, int] = self._coords_for_positions(self._positions_atomic)
+        self.last_values: Dict[str, int] = {}
+        self.running: bool = True
+        
+        # Pending LCD refresh requested by the display thread, consumed by the
+        # monitor thread so the I2C bus has a single owner:
+        # ("interactive", None) or ("screensaver", coords)
+        self._lcd_request: Optional[Tuple[str, Optional[Tuple[int, int, int]]]] = None
+        # Makes taking the request (read + clear) atomic against a new request
+        self._lcd_request_lock = threading.Lock()
+        self._wake = threading.Event()
+        
+        # Called from the monitor thread whenever switch positions or mode change
+        self.on_change: Optional[Callable[[], None]] = None
+        
+        # Last channel written to the multiplexer (None forces a re-select)
+        self._current_channel: Optional[int] = None
+        
+        # Adaptive polling: sample fast while switches move, back off when idle
+        self.fast_poll_interval: float = 0.02  # 20ms right after a change
+        self.idle_poll_interval: float = 0.1  # 100ms steady state
+        self.max_poll_interval: float = 0.5  # 500ms after a long idle period
+        self.idle_backoff_polls: int = 10  # stable polls before backing off further
+        # Positions seen once, waiting for a second equal read (debounce)
+        self._pending_positions: Dict[str, int] = {}
         
         # Initialize 3-way mode switch
         self.three_way_switch = ThreeWaySwitch(three_way_pin_a, three_way_pin_b)
-        self.mode_position = 0  # 0, 1, or 2
-        self.last_mode_position = 0
+        # Mode switch edges wake the monitor thread for an immediate sweep
+        self.three_way_switch.on_change = self._wake.set
+        self.mode_position: int = 0  # 0, 1, or 2
+        self.last_mode_position: int = 0
+        # Image coordinates and mode position published together, so the display
+        # loop gets a consistent pair from one attribute read
+        self._snapshot: Tuple[Tuple[int, int, int], int] = (self._image_coords, self.mode_position)
+        
+        # Optional interrupt-driven wake-up from the PCF8574 INT line
+        self.interrupt_pin: Optional[int] = None
+        self.interrupt_watchdog_interval: float = 5.0  # safety poll while waiting for edges
+        if interrupt_pin is not None:
+            self._init_interrupts(interrupt_pin)
         
         # Load labels
         self.labels = None
@@ -138,9 +341,21 @@ class SwitchController:
             print(f"Loaded labels from {labels_file}")
         else:
             print("No labels file found, using switch positions only")
+        # Labels per switch, pre-truncated to the LCD width; without a labels file,
+        # the numeric "SWn: Pos i" lines are built once here instead
+        if self.labels:
+            self._lcd_labels: Tuple[Tuple[str, ...], ...] = tuple(
+                tuple(label[:20] for label in self.labels[key]) for key in ("first", "second", "third")
+            )
+        else:
+            self._lcd_labels = tuple(
+                tuple(f"SW{number}: Pos {position}" for position in range(6)) for number in (1, 2, 3)
+            )
         
         # Initialize LCD on channel 3 (same as switch_monitor)
-        self.lcd = None
+        self.lcd: Optional[CharLCD] = None
+        # Text currently shown on each LCD row (None = unknown, rewrite fully)
+        self._last_lcd_lines: List[Optional[str]] = [None, None, None, None]
         self._init_lcd()
         
         # Show initialization message
@@ -150,219 +365,336 @@ class SwitchController:
         self.monitor_thread = threading.Thread(target=self._monitor_switches, daemon=True)
         self.monitor_thread.start()
     
-    def select_channel(self, channel):
+    def _init_interrupts(self, interrupt_pin: int) -> bool:
+        """Wake the monitor thread on PCF8574 INT edges"""
+        if GPIO is None:
+            print("Switch interrupt disabled - RPi.GPIO not available")
+            return False
+        try:
+            GPIO.setup(interrupt_pin, GPIO.IN, pull_up_down=GPIO.PUD_UP)
+            # INT is active-low and asserts whenever any PCF8574 input changes
+            GPIO.add_event_detect(interrupt_pin, GPIO.FALLING, callback=self._on_interrupt, bouncetime=3)
+            # (the mode switch wakes the thread through its own edge callback)
+            self.interrupt_pin = interrupt_pin
+            print(f"Switch interrupt enabled on GPIO pin {interrupt_pin}")
+            return True
+        except Exception as e:
+            print(f"Switch interrupt init error: {e}")
+            return False
+
+    def _on_interrupt(self, channel: int) -> None:
+        """GPIO edge callback: wake the monitor thread for an immediate sweep"""
+        self._wake.set()
+
+    def select_channel(self, channel: int) -> bool:
         """Select which channel of the PCA9548A multiplexer to use"""
-        channel_values = {0: 0x01, 1: 0x02, 2: 0x04, 3: 0x08, 4: 0x10, 5: 0x20, 6: 0x40, 7: 0x80}
+        if self._current_channel == channel:
+            return True
         try:
-            bus.write_byte(0x70, channel_values[channel])
-            time.sleep(0.01)
+            # The mux switches in microseconds, no settling delay needed
+            bus.write_byte(MUX_ADDRESS, 1 << channel)
+            self._current_channel = channel
             return True
         except Exception as e:
+            self._current_channel = None
             return False
 
-    def read_device(self, channel, address):
-        """Read data from a specific device"""
+    def read_device(self, channel: int, address: int) -> Optional[int]:
+        """Read data from a specific device
+        
+        The mux write and the device read are issued as one I2C_RDWR
+        transaction (repeated start), skipping the mux write entirely when
+        the channel is already selected.
+        """
         try:
-            if not self.select_channel(channel):
-                return None
-            data = bus.read_byte(address)
-            return data
+            read_msg = i2c_msg.read(address, 1)
+            if self._current_channel == channel:
+                bus.i2c_rdwr(read_msg)
+            else:
+                mux_msg = i2c_msg.write(MUX_ADDRESS, [1 << channel])
+                bus.i2c_rdwr(mux_msg, read_msg)
+                self._current_channel = channel
+            return list(read_msg)[0]
         except Exception as e:
+            self._current_channel = None
             return None
 
-    def decode_switch_position(self, data):
+    def read_switches(self) -> List[Optional[int]]:
+        """Read all switch devices, in self.devices order
+        
+        The mux selects and device reads for every switch are queued in a single
+        I2C_RDWR ioctl. If that transaction fails (e.g. one device NACKs), each
+        device is read on its own so one bad switch does not hide the others.
+        """
+        messages = []
+        read_msgs = []
+        for channel, address in self._device_bus:
+            read_msg = i2c_msg.read(address, 1)
+            messages.append(i2c_msg.write(MUX_ADDRESS, [1 << channel]))
+            messages.append(read_msg)
+            read_msgs.append(read_msg)
+        try:
+            bus.i2c_rdwr(*messages)
+            self._current_channel = self._device_bus[-1][0]
+            return [list(msg)[0] for msg in read_msgs]
+        except Exception:
+            self._current_channel = None
+            return [self.read_device(channel, address) for channel, address in self._device_bus]
+
+    def decode_switch_position(self, data: int) -> Optional[int]:
         """Decode 6-position switch from PCF8574 data"""
-        position_map = {
-            0xFE: 1,  # P0 low
-            0xFD: 2,  # P1 low  
-            0xFB: 3,  # P2 low
-            0xF7: 4,  # P3 low
-            0xEF: 5,  # P4 low
-            0xDF: 6,  # P5 low
-        }
-        return position_map.get(data, None)
+        return _POS_LUT[data] or None
     
-    def _init_lcd(self):
+    def _init_lcd(self) -> bool:
         """Initialize LCD on channel 3"""
         try:
-            with channel_lock:
-                if self.select_channel(3):  # LCD is on channel 3 (SD3)
-                    self.lcd = CharLCD('PCF8574', 0x27)
-                    self.lcd.clear()
-                    print("LCD initialized successfully")
-                    return True
+            if self.select_channel(3):  # LCD is on channel 3 (SD3)
+                self.lcd = CharLCD('PCF8574', 0x27)
+                self.lcd.clear()
+                self._last_lcd_lines = ["", "", "", ""]
+                print("LCD initialized successfully")
+                return True
         except Exception as e:
             print(f"LCD init error: {e}")
             return False
         return False
     
-    def _show_initializing_message(self):
+    def _show_initializing_message(self) -> bool:
         """Display initialization message on LCD"""
         try:
             if self.lcd is None:
                 return False
             
-            with channel_lock:
-                if not self.select_channel(3):  # LCD is on channel 3 (SD3)
-                    return False
-                
-                self.lcd.clear()
-                
-                # Put the initialization message on the first line
-                self.lcd.cursor_pos = (0, 0)
-                self.lcd.write_string("*** INITIALIZING ***")
-                
+            if not self.select_channel(3):  # LCD is on channel 3 (SD3)
+                return False
+            
+            self.lcd.clear()
+            
+            # Put the initialization message on the first line
+            self.lcd.cursor_pos = (0, 0)
+            self.lcd.write_string("*** INITIALIZING ***")
+            self._last_lcd_lines = ["*** INITIALIZING ***", "", "", ""]
+            
             return True
         except Exception as e:
             print(f"LCD initialization message error: {e}")
             return False
     
-    def _update_lcd_display(self):
-        """Update LCD with current switch labels"""
+    def _lcd_lines_for_coords(self, title: str, coords: Tuple[int, int, int]) -> List[str]:
+        """Build the four LCD lines for the given title and image coordinates"""
+        labels = self._lcd_labels
+        # Note: coords[2] is already reversed from get_image_coordinates()
+        return [title, labels[0][coords[0]], labels[1][coords[1]], labels[2][coords[2]]]
+    
+    def _write_lcd_lines(self, lines: List[str]) -> bool:
+        """Write only the LCD characters that differ from what is already shown
+        
+        Skips the slow clear() command. Within a changed line only the span
+        between the common prefix and common suffix is rewritten; a shorter
+        line is padded with spaces to erase the previous text's tail.
+        """
+        if self.lcd is None:
+            return False
+        if not self.select_channel(3):  # LCD is on channel 3 (SD3)
+            return False
         try:
-            if self.lcd is None:
-                return False
-            
-            with channel_lock:
-                if not self.select_channel(3):  # LCD is on channel 3 (SD3)
-                    return False
-                
-                self.lcd.clear()
-                
-                # Line 1: Title (back to original)
-                self.lcd.cursor_pos = (0, 0)
-                self.lcd.write_string("*** INTER-ACTIVE ***")
-                
-                if self.labels:
-                    # Show descriptive labels for 6-position switches
-                    # Note: 3rd switch labels are reversed to match coordinate mapping
-                    labels_text = [
-                        self.labels['first'][self.switch_positions['SWITCH_1'] - 1],
-                        self.labels['second'][self.switch_positions['SWITCH_2'] - 1], 
-                        self.labels['third'][5 - (self.switch_positions['SWITCH_3'] - 1)],  # Reversed
-                    ]
-                    
-                    for i, text in enumerate(labels_text):
-                        self.lcd.cursor_pos = (i + 1, 0)
-                        self.lcd.write_string(text[:20])  # Truncate to LCD width
+            for row, text in enumerate(lines):
+                previous = self._last_lcd_lines[row]
+                if text == previous:
+                    continue
+                if previous is None:
+                    # Unknown contents (first write or after an error): overwrite the full row
+                    self.lcd.cursor_pos = (row, 0)
+                    self.lcd.write_string(text.ljust(20))
                 else:
-                    # Show switch positions as 0-5 (6-position switches only)
-                    coords = self.get_image_coordinates()
-                    self.lcd.cursor_pos = (1, 0)
-                    self.lcd.write_string(f"SW1: Pos {coords[0]}")
-                    self.lcd.cursor_pos = (2, 0)
-                    self.lcd.write_string(f"SW2: Pos {coords[1]}")
-                    self.lcd.cursor_pos = (3, 0)
-                    self.lcd.write_string(f"SW3: Pos {coords[2]}")
-                
-            return True
+                    width = max(len(text), len(previous))
+                    new, old = text.ljust(width), previous.ljust(width)
+                    start = 0
+                    while start < width and new[start] == old[start]:
+                        start += 1
+                    end = width
+                    while end > start and new[end - 1] == old[end - 1]:
+                        end -= 1
+                    # Equal after padding means only trailing spaces differed
+                    if start < end:
+                        self.lcd.cursor_pos = (row, start)
+                        self.lcd.write_string(new[start:end])
+                self._last_lcd_lines[row] = text
+        except Exception:
+            self._last_lcd_lines = [None, None, None, None]
+            raise
+        return True
+    
+    def _update_lcd_display(self) -> bool:
+        """Update LCD with current switch labels"""
+        try:
+            return self._write_lcd_lines(
+                self._lcd_lines_for_coords("*** INTER-ACTIVE ***", self.get_image_coordinates())
+            )
         except Exception as e:
             print(f"LCD update error: {e}")
             return False
 
-    def update_lcd_for_coords(self, coords: Tuple[int, int, int]) -> bool:
+    def request_lcd_update(self, coords: Optional[Tuple[int, int, int]] = None) -> None:
+        """Ask the monitor thread to refresh the LCD
+        
+        With coords the screensaver labels for those image coordinates are shown,
+        otherwise the interactive view of the current switch positions.
+        """
+        request = ("screensaver", coords) if coords is not None else ("interactive", None)
+        with self._lcd_request_lock:
+            self._lcd_request = request
+        self._wake.set()
+
+    def _update_lcd_for_coords(self, coords: Tuple[int, int, int]) -> bool:
         """Update LCD with labels corresponding to provided image coordinates"""
         try:
-            if self.lcd is None:
-                return False
-            with channel_lock:
-                if not self.select_channel(3):
-                    return False
-                self.lcd.clear()
-                
-                # Line 1: Title (back to original)
-                self.lcd.cursor_pos = (0, 0)
-                self.lcd.write_string("*** SCREEN-SAVER ***")
-                
-                if self.labels:
-                    # Note: coords[2] is already reversed from get_image_coordinates()
-                    lines = [
-                        self.labels['first'][coords[0]],
-                        self.labels['second'][coords[1]],
-                        self.labels['third'][coords[2]],
-                    ]
-                    for i, text in enumerate(lines):
-                        self.lcd.cursor_pos = (i + 1, 0)
-                        self.lcd.write_string(text[:20])
-                else:
-                    self.lcd.cursor_pos = (1, 0)
-                    self.lcd.write_string(f"SW1: Pos {coords[0]}")
-                    self.lcd.cursor_pos = (2, 0)
-                    self.lcd.write_string(f"SW2: Pos {coords[1]}")
-                    self.lcd.cursor_pos = (3, 0)
-                    self.lcd.write_string(f"SW3: Pos {coords[2]}")
-            return True
+            return self._write_lcd_lines(self._lcd_lines_for_coords("*** SCREEN-SAVER ***", coords))
         except Exception as e:
             print(f"LCD update error: {e}")
             return False
 
-    def _monitor_switches(self):
+    def _monitor_switches(self) -> None:
         """Monitor all switches including 3-way mode switch in background thread"""
         print("Starting switch monitoring...")
         
         # Don't immediately update LCD - let initialization message show
         # LCD will be updated when switches change or when screensaver starts
         
+        poll_interval: float = self.idle_poll_interval
+        stable_count: int = 0
+        
         while self.running:
+            self._wake.clear()
             changes_detected = False
+            positions = list(self._positions_atomic)
             
             # Monitor 6-position switches via I2C
-            with channel_lock:
-                for dev in self.devices:
-                    data = self.read_device(dev['channel'], dev['address'])
-                    dev_key = f"ch{dev['channel']}_0x{dev['address']:02X}"
+            for (name, dev_key, slot), data in zip(self._device_table, self.read_switches()):
+                if data is not None:
+                    # Check if value changed
+                    previous = self.last_values.get(dev_key)
+                    if previous == data and name not in self._pending_positions:
+                        # Same byte as last sweep and nothing awaiting confirmation
+                        continue
+                    if previous is not None and previous != data:
+                        changes_detected = True
                     
-                    if data is not None:
-                        # Check if value changed
-                        if dev_key in self.last_values and self.last_values[dev_key] != data:
+                    self.last_values[dev_key] = data
+                    
+                    # Decode position and commit once two consecutive reads agree
+                    position = _POS_LUT[data]
+                    if position:
+                        if positions[slot] == position:
+                            self._pending_positions.pop(name, None)
+                        elif self._pending_positions.get(name) == position:
+                            del self._pending_positions[name]
+                            positions[slot] = position
                             changes_detected = True
-                        
-                        self.last_values[dev_key] = data
-                        
-                        # Decode position and update if valid
-                        position = self.decode_switch_position(data)
-                        if position is not None:
-                            old_pos = self.switch_positions[dev['name']]
-                            if old_pos != position:
-                                self.switch_positions[dev['name']] = position
-                                changes_detected = True
+                        else:
+                            self._pending_positions[name] = position
+                    else:
+                        # Between detents or a bad contact breaks the run of equal reads
+                        self._pending_positions.pop(name, None)
             
-            # Monitor 3-way mode switch (does not trigger LCD updates)
+            # Publish the new positions with a single attribute assignment
+            new_positions = (positions[0], positions[1], positions[2])
+            positions_changed = new_positions != self._positions_atomic
+            if positions_changed:
+                self._positions_atomic = new_positions
+                self._image_coords = self._coords_for_positions(new_positions)
+            
+            # Monitor 3-way mode switch (does not trigger LCD updates). The pins are
+            # sampled on every sweep, so a reading taken mid-bounce is corrected
+            mode_edge = self.three_way_switch.take_edge()
             new_mode_position = self.three_way_switch.read_position()
             if new_mode_position != self.last_mode_position:
                 self.mode_position = new_mode_position
                 self.last_mode_position = new_mode_position
                 print(f"Mode switch changed to position {new_mode_position}")
+                mode_changed = True
+            else:
+                mode_changed = False
             
-            # Update LCD only when 6-position switches change
-            if changes_detected:
+            if positions_changed or mode_changed:
+                self._snapshot = (self._image_coords, self.mode_position)
+                if self.on_change is not None:
+                    self.on_change()
+            
+            # Update LCD when 6-position switches change or the display asked for it
+            with self._lcd_request_lock:
+                lcd_request = self._lcd_request
+                self._lcd_request = None
+            if lcd_request is not None and lcd_request[0] == "screensaver":
+                self._update_lcd_for_coords(lcd_request[1])
+            elif changes_detected or lcd_request is not None:
                 self._update_lcd_display()
             
-            time.sleep(0.05)  # 50ms for more responsive switch detection
+            # Reset to fast sampling on any activity, back off exponentially when idle
+            # (after a mode switch edge too, to re-sample once the contacts settle)
+            if changes_detected or mode_changed or mode_edge or self._pending_positions:
+                stable_count = 0
+                poll_interval = self.fast_poll_interval
+            elif self.interrupt_pin is not None and self.three_way_switch.edge_detect:
+                # Edges wake us up; only poll occasionally in case one is missed
+                poll_interval = self.interrupt_watchdog_interval
+            else:
+                stable_count += 1
+                if poll_interval < self.idle_poll_interval:
+                    poll_interval = self.idle_poll_interval
+                elif stable_count >= self.idle_backoff_polls:
+                    stable_count = 0
+                    poll_interval = min(poll_interval * 2, self.max_poll_interval)
+            
+            self._wake.wait(timeout=poll_interval)
     
-    def get_image_coordinates(self) -> Tuple[int, int, int]:
-        """Get current image coordinates (0-5) based on switch positions (1-6)"""
+    @staticmethod
+    def _coords_for_positions(positions: Tuple[int, int, int]) -> Tuple[int, int, int]:
+        """Convert switch positions (1-6) to image coordinates (0-5)"""
         return (
-            self.switch_positions["SWITCH_1"] - 1,  # Convert 1-6 to 0-5
-            self.switch_positions["SWITCH_2"] - 1,  # Convert 1-6 to 0-5
-            5 - (self.switch_positions["SWITCH_3"] - 1)  # Reverse: 1->5, 2->4, 3->3, 4->2, 5->1, 6->0
+            positions[0] - 1,  # Convert 1-6 to 0-5
+            positions[1] - 1,  # Convert 1-6 to 0-5
+            5 - (positions[2] - 1)  # Reverse: 1->5, 2->4, 3->3, 4->2, 5->1, 6->0
         )
     
+    def get_image_coordinates(self) -> Tuple[int, int, int]:
+        """Get current image coordinates (0-5) based on switch positions (1-6)
+        
+        Returns the tuple the monitor thread published with the positions, so
+        the same object comes back until a switch actually moves.
+        """
+        return self._image_coords
+    
     def get_mode_position(self) -> int:
         """Get current 3-way mode switch position (0, 1, or 2)"""
         return self.mode_position
     
-    def stop(self):
+    def get_snapshot(self) -> Tuple[Tuple[int, int, int], int]:
+        """Get (image coordinates, mode position) as published by the last sweep"""
+        return self._snapshot
+    
+    def stop(self) -> None:
         """Stop the switch monitoring"""
         self.running = False
-        # Clean up 3-way switch GPIO
+        # Let the monitor thread finish its sweep so it no longer owns the bus
+        self._wake.set()
+        self.monitor_thread.join(timeout=1.0)
+        # Clean up 3-way switch and interrupt GPIO
         self.three_way_switch.cleanup()
-        # Clear LCD on exit
+        if self.interrupt_pin is not None:
+            try:
+                GPIO.cleanup([self.interrupt_pin])
+            except Exception:
+                pass
+        # Clear LCD on exit, unless the monitor thread is still stuck in a bus
+        # transaction: the bus has a single owner, so leave the LCD as it is then
+        if self.monitor_thread.is_alive():
+            print("Switch monitor still running, leaving the LCD as is", file=sys.stderr)
+            return
         try:
             if self.lcd is not None:
-                with channel_lock:
-                    self.select_channel(3)
-                    self.lcd.clear()
+                self.select_channel(3)
+                self.lcd.clear()
         except:
             pass
 
@@ -370,18 +702,25 @@ class SwitchController:
 class AIArtBoxDisplay:
     """Fullscreen pygame display controlled by switches"""
     
-    def __init__(self, images_directory: Path, fullscreen: bool = True, labels_file: Optional[Path] = None):
+    def __init__(
+        self,
+        images_directory: Path,
+        fullscreen: bool = True,
+        labels_file: Optional[Path] = None,
+        switch_interrupt_pin: Optional[int] = None,
+    ):
         self.base_images_directory = images_directory
         self.fullscreen = fullscreen
         
         # Initialize switch controller with labels
-        self.switch_controller = SwitchController(labels_file=labels_file)
+        self.switch_controller = SwitchController(labels_file=labels_file, interrupt_pin=switch_interrupt_pin)
         
         # Current image coordinates
         self.current_coords = (0, 0, 0)
         
-        # Track current mode for directory switching
-        self.current_mode = 0
+        # Track current mode for directory switching. Renders use this, not the live
+        # controller value, so they always match what run() last applied
+        self.current_mode = self.switch_controller.get_snapshot()[1]
         self.last_mode = -1
         
         # Screensaver state
@@ -390,14 +729,15 @@ class AIArtBoxDisplay:
         self.inactivity_seconds = 5 * 60  # 5 minutes
         self.screensaver_cycle_index = 0
         self.screensaver_cycle_interval = 3.0  # seconds per image while in screensaver
-        self._last_cycle_ts = time.time()
+        # Deadlines use the monotonic clock so NTP steps cannot stall or rush them
+        self._next_cycle_ts = time.monotonic() + self.screensaver_cycle_interval
         
         # Track last observed switch coordinates to detect real movement
         self._last_switch_coords: Tuple[int, int, int] = self.switch_controller.get_image_coordinates()
         # Start from the switch coordinates to make labels consistent initially
         self.current_coords = self._last_switch_coords
         # Ensure screensaver starts cycling from the current image
-        self.screensaver_cycle_index = self._coords_to_index(self.current_coords)
+        self.screensaver_cycle_index = _SCREENSAVER_POSITION[self.current_coords]
         # Flag to ignore first switch reading to prevent immediate exit from screensaver
         self._first_switch_read = True
         
@@ -418,139 +758,480 @@ class AIArtBoxDisplay:
             self.screen_height = 1080
             self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.RESIZABLE)
         
-        self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 48)
+        # Rendered status text ("Missing: ...", "Switches: ...") keyed by string
+        self._text_cache: Dict[str, pygame.Surface] = {}
+        # Areas drawn by the last render when only part of the screen changed,
+        # None when the whole screen was (or must be) redrawn
+        self._last_dirty: Optional[List[pygame.Rect]] = None
+        # Where the last render drew an opaque image (letterbox bars already black),
+        # None after any other frame or a display mode change
+        self._last_image_rect: Optional[pygame.Rect] = None
+        # Image file currently on screen, None for the missing-image screen or
+        # after a display mode change
+        self._displayed_path: Optional[str] = None
+        # Longest the main loop sleeps waiting for an event. Switch changes post an
+        # event and scheduled steps set their own deadline, so this is only a
+        # safety net in case a wake-up is lost
+        self.idle_wait_ms = 5000
         
-        # Image cache with memory management
-        self.surface_cache: Dict[Path, pygame.Surface] = {}
-        self.cache_access_order: List[Path] = []  # Track access order for LRU eviction
-        self.max_cache_size: int = 25  # Limit cache to 25 images to save memory
+        # Per-directory image path strings and existence bitmap (see _image_table)
+        self._image_tables: Dict[Path, Tuple[List[str], bytearray]] = {}
+        
+        # Image cache with memory management. Holds surfaces already scaled to
+        # the screen so a render is a plain blit; shared with the warm-up thread.
+        # Ordered from least to most recently used for LRU eviction.
+        self.surface_cache: "OrderedDict[str, pygame.Surface]" = OrderedDict()
+        # Workers cache plain 24/32-bit surfaces; only the main thread converts them
+        # to the display format (which depends on the live display surface), and
+        # these are the cached paths it has already converted
+        self._display_ready: Set[str] = set()
+        self._cache_bytes = 0
+        self.max_cache_bytes: int = _default_cache_budget()  # Bounded by available RAM
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0  # Bumped on clear so stale warm-up threads stop
+        # Cache warm-up runs on a kept worker so it can be stopped and waited for
+        # (before a display mode change and on shutdown); the event stops it early
+        self._warm_executor = ThreadPoolExecutor(max_workers=1)
+        self._warm_stop = threading.Event()
+        self._warm_future: Optional[Future] = None
+        # Decodes the images one switch click away from the current one
+        self._preload_executor = ThreadPoolExecutor(max_workers=1)
+        # Preloads queued or running (guarded by _cache_lock), and the paths the
+        # latest render asked for; queued preloads no longer wanted are skipped
+        self._preload_inflight: Set[str] = set()
+        self._preload_wanted: FrozenSet[str] = frozenset()
+        # Decodes cache misses for the image on screen, so the main loop never
+        # blocks on a decode; separate so it never queues behind preloads
+        self._decode_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_path: Optional[str] = None
+        # Surface handed over by the worker for the pending path, used even if
+        # the cache dropped it in the meantime (e.g. cleared on a mode change)
+        self._ready_surface: Optional[Tuple[str, pygame.Surface]] = None
+        # Images whose decode failed, shown as missing instead of retried until
+        # the next cache clear (guarded by _cache_lock)
+        self._failed_paths: Set[str] = set()
         
         print(f"Display initialized: {self.screen_width}x{self.screen_height}")
         print(f"Fullscreen: {fullscreen}")
-        print(f"Image cache limit: {self.max_cache_size} images")
+        print(f"Image cache limit: {self.max_cache_bytes // (1024 * 1024)} MB")
+        print(f"Smoothscale backend: {pygame.transform.get_smoothscale_backend()}")
         print(f"Base images directory: {self.base_images_directory}")
         
-        # Check for mode directories
+        # Check for mode directories, falling back to the base directory for missing ones
+        self._mode_directories: Dict[int, Path] = {}
         for i in range(3):
             mode_dir = self.base_images_directory / f"mode-{i + 1}"
             if mode_dir.exists():
                 print(f"✓ Mode {i + 1} directory found: {mode_dir}")
+                self._mode_directories[i + 1] = mode_dir
             else:
-                print(f"⚠ Mode {i + 1} directory missing: {mode_dir}")
+                print(f"⚠ Mode {i + 1} directory missing: {mode_dir}, using base directory")
+                self._mode_directories[i + 1] = self.base_images_directory
+        
+        # Wake the main loop as soon as the monitor thread sees a switch change
+        self.switch_controller.on_change = self._post_switch_changed
         
         # Initial render
         self._render()
+        
+        # Pre-load upcoming images in the background so the first changes are instant
+        self._start_cache_warmup()
 
     def _get_current_images_directory(self) -> Path:
-        """Get the current images directory based on mode switch position"""
-        mode_position = self.switch_controller.get_mode_position()
-        
+        """Get the images directory for the mode run() last applied (self.current_mode)"""
         # Map switch positions to mode directories:
         # Position 1 → mode-1, Position 0 → mode-2, Position 2 → mode-3
         position_to_mode = {1: 1, 0: 2, 2: 3}
-        mode_number = position_to_mode.get(mode_position, 1)  # Default to mode-1
-        
-        mode_dir = self.base_images_directory / f"mode-{mode_number}"
+        mode_number = position_to_mode.get(self.current_mode, 1)  # Default to mode-1
         
-        # Fall back to base directory if mode directory doesn't exist
-        if mode_dir.exists():
-            return mode_dir
-        else:
-            print(f"Warning: Mode directory {mode_dir} doesn't exist, using base directory")
-            return self.base_images_directory
+        # Missing mode directories were mapped to the base directory at startup
+        return self._mode_directories[mode_number]
 
-    def _current_filename(self) -> str:
-        """Generate filename based on current coordinates"""
-        return f"{self.current_coords[0]}-{self.current_coords[1]}-{self.current_coords[2]}.jpeg"
-
-    def _current_image_path(self) -> Path:
-        """Get path to current image based on current mode directory"""
-        return self._get_current_images_directory() / self._current_filename()
+    def _image_table(self, images_directory: Path) -> Tuple[List[str], bytearray]:
+        """Get the image path strings and existence bitmap for a directory
+        
+        Both are indexed by screensaver index. The directory is scanned once
+        with os.scandir instead of stat-ing every image before loading it.
+        """
+        table = self._image_tables.get(images_directory)
+        if table is None:
+            paths = [str(images_directory / name) for name in IMAGE_FILENAMES]
+            exists = bytearray(len(IMAGE_FILENAMES))
+            try:
+                with os.scandir(images_directory) as entries:
+                    for entry in entries:
+                        index = _FILENAME_TO_INDEX.get(entry.name)
+                        if index is not None and entry.is_file():
+                            exists[index] = 1
+            except OSError as exc:
+                print(f"Failed to scan images directory '{images_directory}': {exc}", file=sys.stderr)
+            table = (paths, exists)
+            self._image_tables[images_directory] = table
+        return table
 
-    def _load_surface(self, path: Path) -> Optional[pygame.Surface]:
-        """Load and cache image surface with LRU eviction"""
+    def _load_surface(self, path: str) -> Optional[pygame.Surface]:
+        """Load, scale to the screen and cache image surface with LRU eviction"""
         # Check if already cached
-        if path in self.surface_cache:
-            # Move to end of access order (most recently used)
-            self.cache_access_order.remove(path)
-            self.cache_access_order.append(path)
-            return self.surface_cache[path]
+        with self._cache_lock:
+            if path in self.surface_cache:
+                # Move to end of access order (most recently used)
+                self.surface_cache.move_to_end(path)
+                return self.surface_cache[path]
+            generation = self._cache_generation
         
-        if not path.exists():
+        try:
+            surface = self._decode_image(path)
+            if surface.get_bitsize() < 24:
+                # smoothscale needs 24/32-bit pixels; paletted or grayscale sources
+                # from pygame.image.load are copied to 32 bits (keeping transparency)
+                has_alpha = surface.get_flags() & pygame.SRCALPHA or surface.get_colorkey() is not None
+                truecolor = pygame.Surface(surface.get_size(), pygame.SRCALPHA if has_alpha else 0, 32)
+                truecolor.blit(surface, (0, 0))
+                surface = truecolor
+            # No convert() here: that is left to the main thread (_cached_surface)
+            surface = self._get_scaled_surface_and_rect(surface)[0]
+        except Exception as exc:
+            print(f"Failed to load image '{path}': {exc}", file=sys.stderr)
+            with self._cache_lock:
+                # A failure from before a cache clear says nothing about the new cache
+                if generation == self._cache_generation:
+                    self._failed_paths.add(path)
             return None
         
-        try:
-            surface = pygame.image.load(str(path)).convert_alpha()
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                # Cache was cleared (mode change or resize) while decoding
+                return surface
+            if path in self.surface_cache:
+                return self.surface_cache[path]
             
-            # Evict least recently used items if cache is full
-            while len(self.surface_cache) >= self.max_cache_size:
-                if self.cache_access_order:
-                    lru_path = self.cache_access_order.pop(0)  # Remove oldest
-                    if lru_path in self.surface_cache:
-                        del self.surface_cache[lru_path]
-                        print(f"Evicted cached image: {lru_path.name}")
-                else:
-                    break
+            # Evict least recently used items until the new surface fits the budget
+            surface_bytes = self._surface_bytes(surface)
+            self._evict_to_fit(surface_bytes)
             
             # Add new surface to cache
             self.surface_cache[path] = surface
-            self.cache_access_order.append(path)
-            return surface
-        except Exception as exc:
-            print(f"Failed to load image '{path}': {exc}", file=sys.stderr)
-            return None
+            self._cache_bytes += surface_bytes
+        return surface
+
+    def _evict_to_fit(self, extra_bytes: int):
+        """Evict least recently used surfaces until extra_bytes more fit (call with _cache_lock held)"""
+        while self.surface_cache and self._cache_bytes + extra_bytes > self.max_cache_bytes:
+            lru_path, lru_surface = self.surface_cache.popitem(last=False)  # Remove oldest
+            self._cache_bytes -= self._surface_bytes(lru_surface)
+            self._display_ready.discard(lru_path)
+            print(f"Evicted cached image: {os.path.basename(lru_path)}")
+
+    def _cached_surface(self, path: str) -> Optional[pygame.Surface]:
+        """Get a cached screen-scaled surface in the display format, without decoding on a miss
+        
+        Main thread only: a surface a worker cached is converted here on first use
+        and replaces the cache entry, so later renders are a plain blit.
+        """
+        with self._cache_lock:
+            surface = self.surface_cache.get(path)
+            if surface is None:
+                return None
+            self.surface_cache.move_to_end(path)
+            if path in self._display_ready:
+                return surface
+        converted = self._to_display_format(surface)
+        with self._cache_lock:
+            # Unless it was evicted or the cache cleared while converting
+            if self.surface_cache.get(path) is surface:
+                # A 24-bit decode can grow on conversion to a 32-bit display
+                del self.surface_cache[path]
+                self._cache_bytes -= self._surface_bytes(surface)
+                self._evict_to_fit(self._surface_bytes(converted))
+                self.surface_cache[path] = converted
+                self._cache_bytes += self._surface_bytes(converted)
+                self._display_ready.add(path)
+        return converted
+
+    @staticmethod
+    def _to_display_format(surface: pygame.Surface) -> pygame.Surface:
+        """Convert a decoded surface to the display format (main thread only)
+        
+        Only images that actually have per-pixel alpha keep it (JPEGs never do);
+        on a 16-bit display this also halves the memory and blit bandwidth.
+        """
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
+
+    def _decode_for_display(self, path: str):
+        """Decode the image the display is waiting for and wake the main loop"""
+        generation = self._cache_generation
+        surface = self._load_surface(path)
+        try:
+            pygame.event.post(pygame.event.Event(IMAGE_READY_EVENT, path=path, surface=surface, generation=generation))
+        except pygame.error:
+            pass
+
+    def _decode_image(self, path: str) -> pygame.Surface:
+        """Decode an image file into a (not yet display-converted) surface
+        
+        Uses Pillow when available, which releases the GIL while decoding, and
+        wraps its pixels with frombuffer; falls back to pygame.image.load.
+        Oversized JPEGs are decoded straight at a reduced scale (1/2, 1/4, 1/8)
+        that still covers the size they will be shown at.
+        """
+        if Image is None:
+            return pygame.image.load(path)
+        with Image.open(path) as img:
+            img_w, img_h = img.size
+            scale = min(self.screen_width / img_w, self.screen_height / img_h)
+            if scale < 1.0:
+                img.draft("RGB", (max(1, int(img_w * scale)), max(1, int(img_h * scale))))
+            mode = "RGBA" if "A" in img.getbands() or "transparency" in img.info else "RGB"
+            if img.mode != mode:
+                img = img.convert(mode)
+            return pygame.image.frombuffer(img.tobytes(), img.size, mode)
+
+    def _start_cache_warmup(self):
+        """Start filling the cache with upcoming images in the background"""
+        self._stop_cache_warmup()
+        self._warm_stop.clear()
+        self._warm_future = self._warm_executor.submit(
+            self._warm_cache, self._get_current_images_directory(), self._cache_generation
+        )
+
+    def _stop_cache_warmup(self):
+        """Stop the cache warm-up and wait until its current decode has finished"""
+        self._warm_stop.set()
+        if self._warm_future is not None:
+            wait([self._warm_future])
+            self._warm_future = None
+
+    def _warm_cache(self, images_directory: Path, generation: int):
+        """Load images in likely viewing order from the current one until the cache is full"""
+        paths, exists = self._image_table(images_directory)
+        self._prefetch_files(paths, exists)
+        for index in self._warm_order(self.current_coords, self.mode == "screensaver"):
+            with self._cache_lock:
+                # Stop before warm-up starts evicting images it loaded itself
+                full = self._cache_bytes + self._screen_surface_bytes() > self.max_cache_bytes
+                if generation != self._cache_generation or full or self._warm_stop.is_set():
+                    return
+            if exists[index] and paths[index] not in self._failed_paths:
+                self._load_surface(paths[index])
+
+    def _warm_order(self, coords: Tuple[int, int, int], screensaver: bool) -> List[int]:
+        """Get image indices in the order they are likely to be shown next
+        
+        The screensaver follows _SCREENSAVER_ORDER; switch users move one knob
+        at a time, so nearby coordinates (Manhattan distance) come first.
+        """
+        if screensaver:
+            start = _SCREENSAVER_POSITION[coords]
+            return [_COORDS_TO_INDEX[_SCREENSAVER_ORDER[(start + offset) % 216]] for offset in range(216)]
+        a, b, c = coords
+        return sorted(
+            range(216),
+            key=lambda i: abs(_INDEX_TO_COORDS[i][0] - a) + abs(_INDEX_TO_COORDS[i][1] - b) + abs(_INDEX_TO_COORDS[i][2] - c),
+        )
+
+    @staticmethod
+    def _prefetch_files(paths: List[str], exists: bytearray):
+        """Ask the kernel to read all image files into the page cache
+        
+        Images that do not fit the surface cache are then decoded from RAM
+        instead of waiting on the SD card.
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        for index, path in enumerate(paths):
+            if not exists[index]:
+                continue
+            try:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
+
+    def _preload_neighbors(self, paths: List[str], exists: bytearray, coords: Tuple[int, int, int], extra: Optional[int] = None):
+        """Decode the images one step away on any switch (plus index extra) in the background"""
+        indices = []
+        for axis in range(3):
+            for step in (-1, 1):
+                neighbor = list(coords)
+                neighbor[axis] += step
+                if 0 <= neighbor[axis] <= 5:
+                    indices.append(self._coords_to_index((neighbor[0], neighbor[1], neighbor[2])))
+        if extra is not None:
+            indices.append(extra)
+        wanted = [paths[index] for index in indices if exists[index]]
+        # Replaced as a whole so the worker sees either the old or the new set
+        self._preload_wanted = frozenset(wanted)
+        for path in wanted:
+            with self._cache_lock:
+                if path in self.surface_cache or path in self._preload_inflight or path in self._failed_paths:
+                    continue
+                self._preload_inflight.add(path)
+            self._preload_executor.submit(self._preload, path)
+
+    def _preload(self, path: str):
+        """Preload worker: skip paths the display has moved away from since queueing"""
+        try:
+            if path in self._preload_wanted:
+                self._load_surface(path)
+        finally:
+            with self._cache_lock:
+                self._preload_inflight.discard(path)
 
     def _get_cache_stats(self) -> str:
         """Get current cache statistics for monitoring"""
-        return f"Cache: {len(self.surface_cache)}/{self.max_cache_size} images"
+        return (
+            f"Cache: {len(self.surface_cache)} images, "
+            f"{self._cache_bytes // (1024 * 1024)}/{self.max_cache_bytes // (1024 * 1024)} MB"
+        )
+
+    @staticmethod
+    def _surface_bytes(surface: pygame.Surface) -> int:
+        """Get the pixel memory held by a surface"""
+        return surface.get_pitch() * surface.get_height()
+
+    def _screen_surface_bytes(self) -> int:
+        """Get the largest pixel memory a surface scaled to the screen can hold"""
+        return self.screen_width * self.screen_height * self.screen.get_bytesize()
 
     def _clear_cache(self):
         """Clear all cached images to free memory"""
-        self.surface_cache.clear()
-        self.cache_access_order.clear()
+        with self._cache_lock:
+            self._cache_generation += 1
+            self.surface_cache.clear()
+            self._display_ready.clear()
+            self._cache_bytes = 0
+            # Retry failed images too (e.g. a file that was still being copied)
+            self._failed_paths.clear()
+        # A decode still in flight belongs to the old cache; request it again
+        self._pending_path = None
         print("Image cache cleared")
 
     def _render(self):
         """Render current image fullscreen"""
-        self.screen.fill((0, 0, 0))  # Black background
+        screen = self.screen
+        cx, cy = self.screen_width // 2, self.screen_height // 2
+        coords = self.current_coords
+        images_directory = self._get_current_images_directory()
+        paths, exists = self._image_table(images_directory)
+        index = self._coords_to_index(coords)
+        path = paths[index]
+        surface = None
+        if exists[index] and path not in self._failed_paths:
+            surface = self._cached_surface(path)
+            ready = self._ready_surface
+            self._ready_surface = None
+            if surface is None and ready is not None and ready[0] == path:
+                surface = self._to_display_format(ready[1])
+            if surface is None:
+                # Keep the current frame until the worker has decoded this one
+                if path != self._pending_path:
+                    self._pending_path = path
+                    self._decode_executor.submit(self._decode_for_display, path)
+                self._preload_neighbors(paths, exists, coords)
+                return
+        self._pending_path = None
+        next_index = None
+        if self.mode == "screensaver":
+            # Decode the next screensaver image during this one's display time
+            next_step = (_SCREENSAVER_POSITION[coords] + 1) % 216
+            next_index = _COORDS_TO_INDEX[_SCREENSAVER_ORDER[next_step]]
+        self._preload_neighbors(paths, exists, coords, next_index)
         
-        image_path = self._current_image_path()
-        surface = self._load_surface(image_path)
+        # Already on screen (e.g. entering the screensaver on the current image)
+        if surface is not None and path == self._displayed_path:
+            return
         
         if surface is None:
+            # When the previous frame was also a missing-image message only its
+            # text needs erasing; otherwise clear the whole screen
+            previous_dirty = self._last_dirty
+            if previous_dirty is None:
+                screen.fill((0, 0, 0))  # Black background
+            else:
+                for rect in previous_dirty:
+                    screen.fill((0, 0, 0), rect)
             # No crossfade for missing images; render fallback text with mode directory
-            relative_path = image_path.relative_to(self.base_images_directory)
-            message = f"Missing: {relative_path}"
-            text_surface = self.font.render(message, True, (255, 255, 255))
-            rect = text_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
-            self.screen.blit(text_surface, rect)
+            relative_path = (images_directory / IMAGE_FILENAMES[index]).relative_to(self.base_images_directory)
+            text_surface = self._render_text(f"Missing: {relative_path}")
+            rect = text_surface.get_rect()
+            rect.center = (cx, cy)
+            screen.blit(text_surface, rect)
             
-            coords = self.switch_controller.get_image_coordinates()
-            pos_message = f"Switches: {coords[0]}-{coords[1]}-{coords[2]}"
-            pos_surface = self.font.render(pos_message, True, (255, 255, 255))
-            pos_rect = pos_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 2 + 60))
-            self.screen.blit(pos_surface, pos_rect)
+            switch_coords = self.switch_controller.get_image_coordinates()
+            pos_surface = self._render_text(f"Switches: {switch_coords[0]}-{switch_coords[1]}-{switch_coords[2]}")
+            pos_rect = pos_surface.get_rect()
+            pos_rect.center = (cx, cy + 60)
+            screen.blit(pos_surface, pos_rect)
             
-            pygame.display.flip()
+            # Push only the text areas to the display when the rest is unchanged
+            if previous_dirty is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(previous_dirty + [rect, pos_rect])
+            self._last_dirty = [rect, pos_rect]
+            self._last_image_rect = None
+            self._displayed_path = None
             # Do not update last surface on missing image
             return
         
-        # Compute scaled surface and destination rect
-        scaled_surface, blit_rect = self._get_scaled_surface_and_rect(surface)
+        # Cached surfaces are already scaled to the screen, just center them
+        blit_rect = surface.get_rect()
+        blit_rect.center = (cx, cy)
         
-        # Simple render without transition
-        self.screen.fill((0, 0, 0))
-        self.screen.blit(scaled_surface, blit_rect)
-        pygame.display.flip()
+        # Simple render without transition; only the letterbox bars need clearing
+        # (a surface with alpha shows what is behind it, so clear everything then)
+        if surface.get_flags() & pygame.SRCALPHA:
+            screen.fill((0, 0, 0))
+            screen.blit(surface, blit_rect)
+            pygame.display.flip()
+            self._last_image_rect = None
+        elif blit_rect == self._last_image_rect:
+            # Same footprint as the previous image: the bars are still black,
+            # so only the image area changes on screen
+            screen.blit(surface, blit_rect)
+            pygame.display.update(blit_rect)
+        else:
+            for rect in self._letterbox_rects(blit_rect):
+                screen.fill((0, 0, 0), rect)
+            screen.blit(surface, blit_rect)
+            pygame.display.flip()
+            self._last_image_rect = blit_rect
+        self._last_dirty = None
+        self._displayed_path = path
+
+    def _render_text(self, text: str) -> pygame.Surface:
+        """Render white status text, reusing the surface for text seen before"""
+        surface = self._text_cache.get(text)
+        if surface is None:
+            surface = self.font.render(text, True, (255, 255, 255))
+            self._text_cache[text] = surface
+        return surface
+
+    def _letterbox_rects(self, blit_rect: pygame.Rect) -> List[pygame.Rect]:
+        """Get the screen areas around a centered image that the image does not cover"""
+        rects = []
+        if blit_rect.top > 0:
+            rects.append(pygame.Rect(0, 0, self.screen_width, blit_rect.top))
+        if blit_rect.bottom < self.screen_height:
+            rects.append(pygame.Rect(0, blit_rect.bottom, self.screen_width, self.screen_height - blit_rect.bottom))
+        if blit_rect.left > 0:
+            rects.append(pygame.Rect(0, blit_rect.top, blit_rect.left, blit_rect.height))
+        if blit_rect.right < self.screen_width:
+            rects.append(pygame.Rect(blit_rect.right, blit_rect.top, self.screen_width - blit_rect.right, blit_rect.height))
+        return rects
 
     def _get_scaled_surface_and_rect(self, surface: pygame.Surface) -> Tuple[pygame.Surface, pygame.Rect]:
         img_w, img_h = surface.get_size()
         scale = min(self.screen_width / img_w, self.screen_height / img_h)
         if scale != 1.0:
-            scaled_w = max(1, int(img_w * scale))
-            scaled_h = max(1, int(img_h * scale))
-            scaled_surface = pygame.transform.smoothscale(surface, (scaled_w, scaled_h))
+            # Output keeps the source pixel format, which already matches the display
+            scaled_surface = pygame.transform.smoothscale_by(surface, scale)
         else:
             scaled_surface = surface
         blit_rect = scaled_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
@@ -597,15 +1278,28 @@ class AIArtBoxDisplay:
 
     @staticmethod
     def _coords_to_index(coords: Tuple[int, int, int]) -> int:
-        return coords[0] * 36 + coords[1] * 6 + coords[2]
+        return _COORDS_TO_INDEX[coords]
 
     @staticmethod
-    def _index_to_coords(index: int) -> Tuple[int, int, int]:
-        index = index % 216
-        a = index // 36
-        b = (index // 6) % 6
-        c = index % 6
-        return (a, b, c)
+    def _post_switch_changed():
+        """Post a switch change event (called from the switch monitor thread)"""
+        try:
+            pygame.event.post(pygame.event.Event(SWITCH_CHANGED_EVENT))
+        except pygame.error:
+            pass
+
+    def _wait_timeout_ms(self) -> int:
+        """Get how long the main loop may sleep before the next scheduled change
+        
+        That is the next screensaver step, or entering the screensaver once the
+        inactivity timeout runs out.
+        """
+        if self.mode == "screensaver":
+            next_deadline = self._next_cycle_ts
+        else:
+            next_deadline = self.last_interaction_ts + self.inactivity_seconds
+        until_deadline = next_deadline - time.monotonic()
+        return max(1, min(self.idle_wait_ms, int(until_deadline * 1000)))
 
     def run(self):
         """Main display loop"""
@@ -614,30 +1308,54 @@ class AIArtBoxDisplay:
         
         running = True
         while running:
-            # Handle pygame events
-            for event in pygame.event.get():
+            # Sleep until a pygame event, a switch change or the next screensaver step
+            event = pygame.event.wait(self._wait_timeout_ms())
+            events = [event] + pygame.event.get() if event.type != pygame.NOEVENT else []
+            
+            # Handle pygame events (SWITCH_CHANGED_EVENT only wakes the loop)
+            for event in events:
                 if event.type == pygame.QUIT:
                     running = False
+                elif event.type == IMAGE_READY_EVENT:
+                    # Draw the decoded image unless the display has moved on or it
+                    # was scaled before a cache clear (resize)
+                    if event.path == self._pending_path and event.generation == self._cache_generation:
+                        if event.surface is not None:
+                            self._ready_surface = (event.path, event.surface)
+                        self._render()
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
                         running = False
                     elif event.key == pygame.K_F11:
                         # Toggle fullscreen (for testing)
                         self.fullscreen = not self.fullscreen
+                        # Let the warm-up settle before the display surface is replaced
+                        self._stop_cache_warmup()
                         if self.fullscreen:
                             self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.FULLSCREEN)
                         else:
                             self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.RESIZABLE)
+                        self._last_dirty = None
+                        self._last_image_rect = None
+                        self._displayed_path = None
+                        self._start_cache_warmup()
                 elif event.type == pygame.VIDEORESIZE and not self.fullscreen:
+                    self._stop_cache_warmup()
                     self.screen_width = event.w
                     self.screen_height = event.h
                     self.screen = pygame.display.set_mode((self.screen_width, self.screen_height), pygame.RESIZABLE)
+                    self._last_dirty = None
+                    self._last_image_rect = None
+                    self._displayed_path = None
+                    # Cached surfaces were scaled for the old size
+                    self._clear_cache()
                     self._render()
+                    self._start_cache_warmup()
             
-            now = time.time()
+            now = time.monotonic()
+            new_switch_coords, new_mode = self.switch_controller.get_snapshot()
             
             # Check if mode switch changed (different image set) - this does NOT affect screensaver
-            new_mode = self.switch_controller.get_mode_position()
             if new_mode != self.current_mode:
                 # Map positions to mode directories for logging
                 position_to_mode = {1: 1, 0: 2, 2: 3}
@@ -645,14 +1363,17 @@ class AIArtBoxDisplay:
                 new_mode_dir = position_to_mode.get(new_mode, 1)
                 print(f"Mode switch: Position {self.current_mode} (mode-{old_mode_dir}) → Position {new_mode} (mode-{new_mode_dir})")
                 self.current_mode = new_mode
-                # Clear cache when switching modes to avoid showing wrong images
+                # Clear cache when switching modes to avoid showing wrong images,
+                # and re-scan directories in case images were added since
                 self._clear_cache()
+                self._image_tables.clear()
                 # Force re-render with new directory
                 self._render()
+                self._start_cache_warmup()
             
             # Check if 6-position switches changed (user interaction for screensaver)
-            new_switch_coords = self.switch_controller.get_image_coordinates()
-            if new_switch_coords != self._last_switch_coords:
+            # Identity check first: the controller hands back the same tuple until a change
+            if new_switch_coords is not self._last_switch_coords and new_switch_coords != self._last_switch_coords:
                 # Skip the first switch reading to avoid immediate screensaver exit
                 if self._first_switch_read:
                     self._first_switch_read = False
@@ -673,7 +1394,7 @@ class AIArtBoxDisplay:
                     # Immediately update LCD when exiting screensaver mode
                     if was_in_screensaver:
                         try:
-                            self.switch_controller._update_lcd_display()
+                            self.switch_controller.request_lcd_update()
                         except Exception:
                             pass
 
@@ -681,32 +1402,38 @@ class AIArtBoxDisplay:
             if self.mode == "normal" and (now - self.last_interaction_ts >= self.inactivity_seconds):
                 self.mode = "screensaver"
                 # Start cycling from current image
-                self.screensaver_cycle_index = self._coords_to_index(self.current_coords)
-                self._last_cycle_ts = now
+                self.screensaver_cycle_index = _SCREENSAVER_POSITION[self.current_coords]
+                self._next_cycle_ts = now + self.screensaver_cycle_interval
                 # Immediate render keeps current image but with overlay already handled
                 self._render()
                 # Update LCD after render to show screensaver mode with current image labels
                 try:
-                    self.switch_controller.update_lcd_for_coords(self.current_coords)
+                    self.switch_controller.request_lcd_update(self.current_coords)
                 except Exception:
                     pass
 
             # In screensaver mode, cycle through all images periodically
             if self.mode == "screensaver":
-                if now - self._last_cycle_ts >= self.screensaver_cycle_interval:
+                if now >= self._next_cycle_ts:
                     self.screensaver_cycle_index = (self.screensaver_cycle_index + 1) % 216
-                    self.current_coords = self._index_to_coords(self.screensaver_cycle_index)
-                    self._last_cycle_ts = now
+                    self.current_coords = _SCREENSAVER_ORDER[self.screensaver_cycle_index]
+                    # Advance by whole intervals so render time does not add up as drift,
+                    # but skip missed steps instead of bursting through them
+                    self._next_cycle_ts += self.screensaver_cycle_interval
+                    if self._next_cycle_ts <= now:
+                        self._next_cycle_ts = now + self.screensaver_cycle_interval
                     self._render()
                     # Update LCD after image is rendered to sync timing
                     try:
-                        self.switch_controller.update_lcd_for_coords(self.current_coords)
+                        self.switch_controller.request_lcd_update(self.current_coords)
                     except Exception:
                         pass
-            
-            self.clock.tick(30)  # 30 FPS
         
-        # Cleanup
+        # Cleanup: stop every worker before the display goes away
+        self._stop_cache_warmup()
+        self._warm_executor.shutdown(wait=True)
+        self._preload_executor.shutdown(wait=True, cancel_futures=True)
+        self._decode_executor.shutdown(wait=True, cancel_futures=True)
         print(f"Final {self._get_cache_stats()}")
         self._clear_cache()
         self.switch_controller.stop()
@@ -730,6 +1457,12 @@ def main():
         action="store_true",
         help="Run in windowed mode instead of fullscreen (for testing)"
     )
+    parser.add_argument(
+        "--switch-int-pin",
+        type=int,
+        default=None,
+        help="GPIO pin (BCM) wired to the PCF8574 INT lines; enables interrupt-driven switch reads"
+    )
     
     args = parser.parse_args()
     
@@ -738,27 +1471,29 @@ def main():
         print(f"Images directory does not exist: {images_directory}", file=sys.stderr)
         sys.exit(1)
     
-    # Check for some required images
+    # Check for some required images with one directory listing instead of a stat each
     test_images = ["0-0-0.jpeg", "1-1-1.jpeg", "5-5-5.jpeg"]
-    missing_images = []
-    for img in test_images:
-        if not (images_directory / img).exists():
-            missing_images.append(img)
+    try:
+        with os.scandir(images_directory) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        present = set()
+    missing_images = [img for img in test_images if img not in present]
     
     if missing_images:
         print(f"Warning: Some test images missing: {missing_images}")
         print("Continuing anyway...")
     
-    # Look for labels.json file
+    # Look for labels.json file (one stat per candidate, first match wins)
     labels_file = None
-    candidate_labels = [
+    candidate_labels = (
         images_directory / "labels.json",
-        Path(args.images).parent / "labels.json", 
+        images_directory.parent / "labels.json",
         Path(__file__).parent / "labels.json"
-    ]
+    )
     
     for candidate in candidate_labels:
-        if candidate.exists():
+        if candidate.is_file():
             labels_file = candidate
             break
     
@@ -766,7 +1501,8 @@ def main():
         app = AIArtBoxDisplay(
             images_directory=images_directory,
             fullscreen=not args.windowed,
-            labels_file=labels_file
+            labels_file=labels_file,
+            switch_interrupt_pin=args.switch_int_pin
         )
         app.run()
     except KeyboardInterrupt: